@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from airport.models import Flight, FlightSearchIndex
+
+
+class Command(BaseCommand):
+    def handle(self, *args, **options):
+        self.stdout.write("Rebuilding flight search index...")
+        FlightSearchIndex.rebuild(Flight.objects.all())
+        self.stdout.write(self.style.SUCCESS("Flight search index rebuilt!"))
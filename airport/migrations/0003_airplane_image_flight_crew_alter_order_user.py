@@ -0,0 +1,35 @@
+# Generated by Django 4.2.6 on 2026-10-15 06:11
+
+import airport.models
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("airport", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="airplane",
+            name="image",
+            field=models.ImageField(
+                null=True, upload_to=airport.models.airplane_image_file_path
+            ),
+        ),
+        migrations.AddField(
+            model_name="flight",
+            name="crew",
+            field=models.ManyToManyField(related_name="flights", to="airport.crew"),
+        ),
+        migrations.AlterField(
+            model_name="order",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL
+            ),
+        ),
+    ]
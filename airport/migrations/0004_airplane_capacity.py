@@ -0,0 +1,23 @@
+# Generated by Django 4.2.6 on 2026-10-15 06:20
+
+from django.db import migrations, models
+
+
+def fill_airplane_capacity(apps, schema_editor):
+    Airplane = apps.get_model("airport", "Airplane")
+    Airplane.objects.update(capacity=models.F("rows") * models.F("seats_in_row"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("airport", "0003_airplane_image_flight_crew_alter_order_user"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="airplane",
+            name="capacity",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_airplane_capacity, migrations.RunPython.noop),
+    ]
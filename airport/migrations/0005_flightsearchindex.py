@@ -0,0 +1,78 @@
+# Generated by Django 4.2.6 on 2026-10-15 06:13
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_flight_search_index(apps, schema_editor):
+    Flight = apps.get_model("airport", "Flight")
+    FlightSearchIndex = apps.get_model("airport", "FlightSearchIndex")
+    flights = Flight.objects.select_related(
+        "route__source", "route__destination", "airplane"
+    ).annotate(index_tickets_taken=models.Count("tickets"))
+    FlightSearchIndex.objects.bulk_create(
+        [
+            FlightSearchIndex(
+                flight=flight,
+                route=flight.route,
+                source_name=flight.route.source.name,
+                destination_name=flight.route.destination.name,
+                airplane_name=flight.airplane.name,
+                capacity=flight.airplane.capacity,
+                tickets_taken=flight.index_tickets_taken,
+                departure_time=flight.departure_time,
+                arrival_time=flight.arrival_time,
+            )
+            for flight in flights
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("airport", "0004_airplane_capacity"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FlightSearchIndex",
+            fields=[
+                (
+                    "flight",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_index",
+                        serialize=False,
+                        to="airport.flight",
+                    ),
+                ),
+                ("source_name", models.CharField(max_length=255)),
+                ("destination_name", models.CharField(max_length=255)),
+                ("airplane_name", models.CharField(max_length=255)),
+                ("capacity", models.PositiveIntegerField()),
+                ("tickets_taken", models.PositiveIntegerField(default=0)),
+                ("departure_time", models.DateTimeField()),
+                ("arrival_time", models.DateTimeField()),
+                (
+                    "route",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="airport.route",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-departure_time"],
+                "indexes": [
+                    models.Index(
+                        fields=["departure_time", "route"],
+                        name="airport_fli_departu_1d6bf0_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_flight_search_index, migrations.RunPython.noop),
+    ]
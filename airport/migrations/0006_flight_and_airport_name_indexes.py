@@ -0,0 +1,38 @@
+# Generated by Django 4.2.6 on 2026-10-15 06:15
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("airport", "0005_flightsearchindex"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="airport",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="airport_name_upper_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="flight",
+            index=models.Index(
+                fields=["departure_time"], name="airport_fli_departu_abe547_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="flight",
+            index=models.Index(
+                fields=["route", "departure_time"],
+                name="airport_fli_route_i_baa295_idx",
+            ),
+        ),
+    ]
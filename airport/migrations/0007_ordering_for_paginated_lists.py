@@ -0,0 +1,28 @@
+# Generated by Django 4.2.6 on 2026-10-15 06:16
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("airport", "0006_flight_and_airport_name_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="airplanetype",
+            options={"ordering": ["name"]},
+        ),
+        migrations.AlterModelOptions(
+            name="airport",
+            options={"ordering": ["name"]},
+        ),
+        migrations.AlterModelOptions(
+            name="crew",
+            options={"ordering": ["last_name", "first_name"]},
+        ),
+        migrations.AlterModelOptions(
+            name="route",
+            options={"ordering": ["id"]},
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.6 on 2026-10-15 06:40
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def fill_flight_tickets_taken(apps, schema_editor):
+    Flight = apps.get_model("airport", "Flight")
+    Ticket = apps.get_model("airport", "Ticket")
+    Flight.objects.update(
+        tickets_taken=Coalesce(
+            models.Subquery(
+                Ticket.objects.filter(flight=models.OuterRef("pk"))
+                .order_by()
+                .values("flight")
+                .annotate(count=models.Count("*"))
+                .values("count")
+            ),
+            0,
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("airport", "0007_ordering_for_paginated_lists"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="flight",
+            name="tickets_taken",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_flight_tickets_taken, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.6 on 2026-10-15 07:05
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("airport", "0008_flight_tickets_taken"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="airplane",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="flight",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -1,8 +1,11 @@
 import os
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Upper
+from django.utils import timezone
 from django.utils.text import slugify
 
 from airport_service import settings
@@ -15,6 +18,15 @@ class Airport(models.Model):
     def __str__(self) -> str:
         return f"{self.name} in {self.closest_big_city}"
 
+    class Meta:
+        ordering = ["name"]
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="airport_name_upper_trgm"
+            )
+        ]
+
 
 class Route(models.Model):
     source = models.ForeignKey(Airport, on_delete=models.CASCADE, related_name="source_routes")
@@ -24,6 +36,9 @@ class Route(models.Model):
     def __str__(self) -> str:
         return f"{self.source} {self.destination}"
 
+    class Meta:
+        ordering = ["id"]
+
 
 class AirplaneType(models.Model):
     name = models.CharField(max_length=255, unique=True)
@@ -31,6 +46,9 @@ class AirplaneType(models.Model):
     def __str__(self) -> str:
         return f"{self.name}"
 
+    class Meta:
+        ordering = ["name"]
+
 
 def airplane_image_file_path(instance, filename):
     _, extension = os.path.splitext(filename)
@@ -49,10 +67,24 @@ class Airplane(models.Model):
         related_name="airplanes"
     )
     image = models.ImageField(upload_to=airplane_image_file_path, null=True)
+    capacity = models.PositiveIntegerField(default=0, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
-    @property
-    def capacity(self) -> int:
-        return self.rows * self.seats_in_row
+    def save(
+            self,
+            force_insert=False,
+            force_update=False,
+            using=None,
+            update_fields=None,
+    ):
+        self.capacity = self.rows * self.seats_in_row
+        if update_fields is not None and (
+            {"rows", "seats_in_row"} & set(update_fields)
+        ):
+            update_fields = {*update_fields, "capacity"}
+        return super(Airplane, self).save(
+            force_insert, force_update, using, update_fields
+        )
 
     def __str__(self) -> str:
         return f"{self.name}"
@@ -72,6 +104,9 @@ class Crew(models.Model):
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}"
 
+    class Meta:
+        ordering = ["last_name", "first_name"]
+
 
 class Order(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -90,12 +125,25 @@ class Flight(models.Model):
     departure_time = models.DateTimeField()
     arrival_time = models.DateTimeField()
     crew = models.ManyToManyField(Crew, related_name="flights")
+    tickets_taken = models.PositiveIntegerField(default=0, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @staticmethod
+    def change_tickets_taken(flight_id, delta):
+        Flight.objects.filter(pk=flight_id).update(
+            tickets_taken=models.F("tickets_taken") + delta,
+            updated_at=timezone.now()
+        )
 
     def __str__(self) -> str:
         return f"{self.route} {self.departure_time}"
 
     class Meta:
         ordering = ["-departure_time"]
+        indexes = [
+            models.Index(fields=["departure_time"]),
+            models.Index(fields=["route", "departure_time"]),
+        ]
 
 
 class Ticket(models.Model):
@@ -129,21 +177,81 @@ class Ticket(models.Model):
             ValidationError,
         )
 
-    def save(
-            self,
-            force_insert=False,
-            force_update=False,
-            using=None,
-            update_fields=None,
-    ):
-        self.full_clean()
-        return super(Ticket, self).save(
-            force_insert, force_update, using, update_fields
-        )
-
     def __str__(self):
         return f"{str(self.flight)} (row:{self.row}, seat:{self.seat})"
 
     class Meta:
         unique_together = ("flight", "row", "seat")
         ordering = ["row", "seat"]
+
+
+class FlightSearchIndex(models.Model):
+    flight = models.OneToOneField(
+        Flight,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_index"
+    )
+    route = models.ForeignKey(Route, on_delete=models.CASCADE, related_name="+")
+    source_name = models.CharField(max_length=255)
+    destination_name = models.CharField(max_length=255)
+    airplane_name = models.CharField(max_length=255)
+    capacity = models.PositiveIntegerField()
+    tickets_taken = models.PositiveIntegerField(default=0)
+    departure_time = models.DateTimeField()
+    arrival_time = models.DateTimeField()
+
+    @property
+    def tickets_available(self) -> int:
+        return self.capacity - self.tickets_taken
+
+    @staticmethod
+    def rebuild(flights):
+        flights = flights.select_related(
+            "route__source", "route__destination", "airplane"
+        )
+        FlightSearchIndex.objects.bulk_create(
+            [
+                FlightSearchIndex(
+                    flight=flight,
+                    route=flight.route,
+                    source_name=flight.route.source.name,
+                    destination_name=flight.route.destination.name,
+                    airplane_name=flight.airplane.name,
+                    capacity=flight.airplane.capacity,
+                    tickets_taken=flight.tickets_taken,
+                    departure_time=flight.departure_time,
+                    arrival_time=flight.arrival_time,
+                )
+                for flight in flights
+            ],
+            update_conflicts=True,
+            unique_fields=["flight"],
+            update_fields=[
+                "route",
+                "source_name",
+                "destination_name",
+                "airplane_name",
+                "capacity",
+                "tickets_taken",
+                "departure_time",
+                "arrival_time",
+            ],
+        )
+
+    @staticmethod
+    def refresh_tickets_taken(flight_ids):
+        FlightSearchIndex.objects.filter(flight_id__in=flight_ids).update(
+            tickets_taken=models.Subquery(
+                Flight.objects.filter(pk=models.OuterRef("flight")).values(
+                    "tickets_taken"
+                )
+            )
+        )
+
+    def __str__(self) -> str:
+        return f"{self.source_name} {self.destination_name} {self.departure_time}"
+
+    class Meta:
+        ordering = ["-departure_time"]
+        indexes = [models.Index(fields=["departure_time", "route"])]
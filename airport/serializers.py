@@ -1,4 +1,7 @@
-from django.db import transaction
+from collections import Counter
+
+from django.db import models, transaction
+from django.db.models import Q
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
@@ -9,10 +12,13 @@ from airport.models import (
     Crew,
     Order,
     Flight,
+    FlightSearchIndex,
     Ticket,
     Route
 )
 
+TICKETS_BATCH_SIZE = 500
+
 
 class AirportSerializer(serializers.ModelSerializer):
     class Meta:
@@ -85,7 +91,29 @@ class AirplaneListSerializer(AirplaneSerializer):
         )
 
 
+class SniffedImageField(serializers.FileField):
+    default_error_messages = {
+        "invalid_image": serializers.ImageField.default_error_messages[
+            "invalid_image"
+        ],
+    }
+
+    def to_internal_value(self, data):
+        file_object = super().to_internal_value(data)
+        header = file_object.read(12)
+        file_object.seek(0)
+        if not (
+            header.startswith(b"\xff\xd8\xff")
+            or header.startswith(b"\x89PNG\r\n\x1a\n")
+            or (header[:4] == b"RIFF" and header[8:12] == b"WEBP")
+        ):
+            self.fail("invalid_image")
+        return file_object
+
+
 class AirplaneImageSerializer(serializers.ModelSerializer):
+    image = SniffedImageField()
+
     class Meta:
         model = Airplane
         fields = ("id", "image")
@@ -97,20 +125,33 @@ class CrewSerializer(serializers.ModelSerializer):
         fields = ("id", "first_name", "last_name")
 
 
+class PrefetchedFlightField(serializers.PrimaryKeyRelatedField):
+    def to_internal_value(self, data):
+        flights = self.context.get("flights", {})
+        if str(data).isdecimal() and int(data) in flights:
+            return flights[int(data)]
+        return super().to_internal_value(data)
+
+
 class TicketSerializer(serializers.ModelSerializer):
+    flight = PrefetchedFlightField(queryset=Flight.objects.all())
+
     def validate(self, attrs):
-        data = super(TicketSerializer, self).validate(attrs=attrs)
         Ticket.validate_ticket(
             attrs["row"],
             attrs["seat"],
             attrs["flight"].airplane,
             ValidationError
         )
-        return data
+        return attrs
 
     class Meta:
         model = Ticket
         fields = ("id", "row", "seat", "flight", "order")
+        read_only_fields = ("order",)
+        # Seat uniqueness is checked for the whole order at once in
+        # OrderSerializer.validate_tickets.
+        validators = []
 
 
 class FlightSerializer(serializers.ModelSerializer):
@@ -126,6 +167,38 @@ class FlightSerializer(serializers.ModelSerializer):
         )
 
 
+# _row renders FlightListSerializer.Meta.fields by hand; keep the two in
+# sync when a field is added or changed.
+class FlightListListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        flights = data.all() if isinstance(data, models.Manager) else data
+        departure_time = self.child.fields["departure_time"]
+        arrival_time = self.child.fields["arrival_time"]
+        return [
+            self._row(flight, departure_time, arrival_time)
+            for flight in flights
+        ]
+
+    @staticmethod
+    def _row(flight, departure_time, arrival_time):
+        row = {
+            "id": flight.id,
+            "route": str(flight.route),
+            "airplane_name": flight.airplane.name,
+            "airplane_capacity": flight.airplane.capacity,
+            "departure_time": departure_time.to_representation(
+                flight.departure_time
+            ),
+            "arrival_time": arrival_time.to_representation(
+                flight.arrival_time
+            ),
+            "crew": [member.full_name for member in flight.crew.all()],
+        }
+        if hasattr(flight, "tickets_available"):
+            row["tickets_available"] = flight.tickets_available
+        return row
+
+
 class FlightListSerializer(FlightSerializer):
     route = serializers.StringRelatedField(read_only=True)
     airplane_name = serializers.CharField(
@@ -155,6 +228,27 @@ class FlightListSerializer(FlightSerializer):
             "crew",
             "tickets_available"
         )
+        list_serializer_class = FlightListListSerializer
+
+
+class FlightSearchSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(source="flight_id", read_only=True)
+    tickets_available = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = FlightSearchIndex
+        fields = (
+            "id",
+            "route",
+            "source_name",
+            "destination_name",
+            "airplane_name",
+            "capacity",
+            "departure_time",
+            "arrival_time",
+            "tickets_available"
+        )
+        read_only_fields = fields
 
 
 class TicketListSerializer(TicketSerializer):
@@ -170,16 +264,68 @@ class TicketSeatsSerializer(TicketSerializer):
 class OrderSerializer(serializers.ModelSerializer):
     tickets = TicketSerializer(
         many=True,
-        read_only=True,
-        allow_empty=True
+        read_only=False,
+        allow_empty=False
     )
 
+    def to_internal_value(self, data):
+        flight_ids = set()
+        tickets_data = data.get("tickets") if hasattr(data, "get") else None
+        if isinstance(tickets_data, list):
+            for ticket_data in tickets_data:
+                if isinstance(ticket_data, dict):
+                    flight_id = str(ticket_data.get("flight", ""))
+                    if flight_id.isdecimal():
+                        flight_ids.add(int(flight_id))
+        self.context["flights"] = Flight.objects.select_related(
+            "airplane"
+        ).in_bulk(flight_ids)
+        return super().to_internal_value(data)
+
+    def validate_tickets(self, tickets):
+        seats = set()
+        for ticket in tickets:
+            seat = (ticket["flight"].id, ticket["row"], ticket["seat"])
+            if seat in seats:
+                raise ValidationError(
+                    f"Seat (row: {ticket['row']}, seat: {ticket['seat']}) "
+                    f"is ordered more than once for flight {seat[0]}"
+                )
+            seats.add(seat)
+
+        seats_filter = Q()
+        for flight_id, row, seat in seats:
+            seats_filter |= Q(flight_id=flight_id, row=row, seat=seat)
+        taken_seat = (
+            Ticket.objects.filter(seats_filter)
+            .values_list("flight_id", "row", "seat")
+            .first()
+        )
+        if taken_seat:
+            flight_id, row, seat = taken_seat
+            raise ValidationError(
+                f"Seat (row: {row}, seat: {seat}) "
+                f"is already taken for flight {flight_id}"
+            )
+        return tickets
+
     def create(self, validated_data):
         with transaction.atomic():
             tickets_data = validated_data.pop("tickets")
             order = Order.objects.create(**validated_data)
-            for ticket_data in tickets_data:
-                Ticket.objects.create(order=order, **ticket_data)
+            Ticket.objects.bulk_create(
+                [
+                    Ticket(order=order, **ticket_data)
+                    for ticket_data in tickets_data
+                ],
+                batch_size=TICKETS_BATCH_SIZE
+            )
+            tickets_per_flight = Counter(
+                ticket_data["flight"].id for ticket_data in tickets_data
+            )
+            for flight_id, tickets_count in tickets_per_flight.items():
+                Flight.change_tickets_taken(flight_id, tickets_count)
+            FlightSearchIndex.refresh_tickets_taken(tickets_per_flight)
             return order
 
     class Meta:
@@ -0,0 +1,134 @@
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from airport.models import (
+    Airport,
+    Airplane,
+    AirplaneType,
+    Crew,
+    Flight,
+    FlightSearchIndex,
+    Route,
+    Ticket
+)
+
+
+@receiver(post_save, sender=Airport)
+@receiver(post_delete, sender=Airport)
+@receiver(post_save, sender=AirplaneType)
+@receiver(post_delete, sender=AirplaneType)
+@receiver(post_save, sender=Route)
+@receiver(post_delete, sender=Route)
+def clear_api_lists_cache(sender, **kwargs):
+    transaction.on_commit(caches["api_lists"].clear)
+
+
+@receiver(post_save, sender=Flight)
+def update_flight_search_index_for_flight(sender, instance, **kwargs):
+    FlightSearchIndex.rebuild(Flight.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Route)
+def update_flight_search_index_for_route(sender, instance, created, **kwargs):
+    if not created:
+        FlightSearchIndex.rebuild(Flight.objects.filter(route=instance))
+
+
+@receiver(post_save, sender=Airport)
+def update_flight_search_index_for_airport(sender, instance, created, **kwargs):
+    if not created:
+        FlightSearchIndex.rebuild(
+            Flight.objects.filter(
+                Q(route__source=instance) | Q(route__destination=instance)
+            )
+        )
+
+
+@receiver(post_save, sender=Airplane)
+def update_flight_search_index_for_airplane(sender, instance, created, **kwargs):
+    if not created:
+        FlightSearchIndex.rebuild(Flight.objects.filter(airplane=instance))
+
+
+@receiver(pre_save, sender=Ticket)
+def remember_ticket_flight(sender, instance, **kwargs):
+    instance._previous_flight_id = None
+    if instance.pk is not None:
+        instance._previous_flight_id = (
+            Ticket.objects.filter(pk=instance.pk)
+            .values_list("flight_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Ticket)
+def count_saved_ticket(sender, instance, created, **kwargs):
+    previous_flight_id = getattr(instance, "_previous_flight_id", None)
+    if created:
+        Flight.change_tickets_taken(instance.flight_id, 1)
+        FlightSearchIndex.refresh_tickets_taken([instance.flight_id])
+    elif previous_flight_id not in (None, instance.flight_id):
+        Flight.change_tickets_taken(previous_flight_id, -1)
+        Flight.change_tickets_taken(instance.flight_id, 1)
+        FlightSearchIndex.refresh_tickets_taken(
+            [previous_flight_id, instance.flight_id]
+        )
+
+
+@receiver(post_delete, sender=Ticket)
+def count_deleted_ticket(sender, instance, **kwargs):
+    Flight.change_tickets_taken(instance.flight_id, -1)
+    FlightSearchIndex.refresh_tickets_taken([instance.flight_id])
+
+
+@receiver(m2m_changed, sender=Flight.crew.through)
+def touch_flights_on_crew_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        flights = Flight.objects.filter(pk=instance.pk)
+    elif action == "pre_clear":
+        flights = Flight.objects.filter(crew=instance)
+    else:
+        flights = Flight.objects.filter(pk__in=pk_set)
+    flights.update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Crew)
+@receiver(pre_delete, sender=Crew)
+def touch_flights_for_crew(sender, instance, **kwargs):
+    Flight.objects.filter(crew=instance).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Route)
+def touch_flights_for_route(sender, instance, created, **kwargs):
+    if not created:
+        Flight.objects.filter(route=instance).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Airport)
+def touch_flights_for_airport(sender, instance, created, **kwargs):
+    if not created:
+        Flight.objects.filter(
+            Q(route__source=instance) | Q(route__destination=instance)
+        ).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=AirplaneType)
+def touch_airplanes_for_airplane_type(sender, instance, created, **kwargs):
+    if not created:
+        Airplane.objects.filter(airplane_type=instance).update(
+            updated_at=timezone.now()
+        )
@@ -69,7 +69,33 @@ class AuthenticatedAirplaneAPITest(TestCase):
         serializer = AirplaneListSerializer(airplanes, many=True)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data["results"], serializer.data)
+
+    def test_airplanes_list_loads_no_deferred_fields(self):
+        sample_airplane()
+        Airplane.objects.create(
+            name="other",
+            rows=3,
+            seats_in_row=5,
+            airplane_type=sample_airplane_type(name="othertype"),
+        )
+
+        with self.assertNumQueries(3):
+            self.client.get(AIRPLANE_URL)
+
+    def test_airplanes_list_etag_changes_with_airplane_type_name(self):
+        airplane = sample_airplane()
+        etag = self.client.get(AIRPLANE_URL)["ETag"]
+
+        airplane_type = airplane.airplane_type
+        airplane_type.name = "renamedtype"
+        airplane_type.save()
+        response = self.client.get(AIRPLANE_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"][0]["airplane_type"], "renamedtype"
+        )
 
     def test_create_airplane_forbidden(self):
         payload = {
@@ -91,6 +117,15 @@ class AuthenticatedAirplaneAPITest(TestCase):
 
         self.assertEqual(serializer.data["capacity"], expected_capacity)
 
+    def test_airplane_capacity_updated_on_save(self):
+        airplane = sample_airplane()
+
+        airplane.rows = 20
+        airplane.save(update_fields=["rows"])
+        airplane.refresh_from_db()
+
+        self.assertEqual(airplane.capacity, 20 * airplane.seats_in_row)
+
 
 class AdminAirplaneAPITest(TestCase):
     def setUp(self):
@@ -155,6 +190,27 @@ class AirplaneImageUploadTests(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_upload_non_image_file_rejected(self):
+        url = image_upload_url(self.airplane.id)
+        with tempfile.NamedTemporaryFile(suffix=".jpg") as ntf:
+            ntf.write(b"not an image")
+            ntf.seek(0)
+            response = self.client.post(url, {"image": ntf}, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_upload_png_image_to_airplane(self):
+        url = image_upload_url(self.airplane.id)
+        with tempfile.NamedTemporaryFile(suffix=".png") as ntf:
+            img = Image.new("RGB", (10, 10))
+            img.save(ntf, format="PNG")
+            ntf.seek(0)
+            response = self.client.post(url, {"image": ntf}, format="multipart")
+        self.airplane.refresh_from_db()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(os.path.exists(self.airplane.image.path))
+
     def test_image_url_is_shown_on_airplane_list(self):
         url = image_upload_url(self.airplane.id)
         with tempfile.NamedTemporaryFile(suffix=".jpg") as ntf:
@@ -164,4 +220,4 @@ class AirplaneImageUploadTests(TestCase):
             self.client.post(url, {"image": ntf}, format="multipart")
         response = self.client.get(AIRPLANE_URL)
 
-        self.assertIn("image", response.data[0].keys())
+        self.assertIn("image", response.data["results"][0].keys())
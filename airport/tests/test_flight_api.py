@@ -12,8 +12,10 @@ from airport.models import Crew, Flight, Order, Ticket, Route
 from airport.serializers import FlightListSerializer, FlightDetailSerializer
 from airport.tests.test_airplane_api import sample_airplane
 from airport.tests.test_route_api import sample_route, sample_airport
+from airport.views import FlightViewSet
 
 FLIGHT_URL = reverse("airport:flight-list")
+FLIGHT_SEARCH_URL = reverse("airport:flightsearchindex-list")
 
 
 def sample_crew(**params):
@@ -85,14 +87,88 @@ class AuthenticatedFlightApiTests(TestCase):
             arrival_time="2024-01-29T10:00:00Z"
         )
 
-        flights = Flight.objects.order_by("id")
+        flights = Flight.objects.all()
         serializer = FlightListSerializer(flights, many=True)
 
         response = self.client.get(FLIGHT_URL)
-        remove_tickets_available(response.data)
+        remove_tickets_available(response.data["results"])
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data["results"], serializer.data)
+
+    def test_list_serializer_matches_flight_list_serializer(self):
+        flight = sample_flight()
+        order = Order.objects.create(user=self.user)
+        Ticket.objects.create(row=1, seat=1, flight=flight, order=order)
+        flights = FlightViewSet.queryset.all()
+
+        serializer = FlightListSerializer(flights, many=True)
+
+        self.assertEqual(
+            serializer.data,
+            [FlightListSerializer(flight).data for flight in flights]
+        )
+        self.assertEqual(
+            serializer.data[0]["tickets_available"],
+            flight.airplane.capacity - 1
+        )
+        self.assertEqual(
+            set(serializer.data[0]), set(FlightListSerializer.Meta.fields)
+        )
+
+    def test_list_flights_not_modified(self):
+        flight = sample_flight()
+
+        response = self.client.get(FLIGHT_URL)
+        etag = response["ETag"]
+        response = self.client.get(FLIGHT_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        order = Order.objects.create(user=self.user)
+        Ticket.objects.create(row=1, seat=1, flight=flight, order=order)
+        response = self.client.get(FLIGHT_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+        response = self.client.get(
+            FLIGHT_URL, {"route": flight.route_id}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_flights_etag_changes_with_crew(self):
+        flight = sample_flight()
+        etag = self.client.get(FLIGHT_URL)["ETag"]
+
+        flight.crew.add(sample_crew(first_name="new"))
+        response = self.client.get(FLIGHT_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        crew = flight.crew.get(first_name="new")
+        crew.last_name = "renamed"
+        crew.save()
+        response = self.client.get(FLIGHT_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("new renamed", response.data["results"][0]["crew"])
+
+    def test_list_flights_etag_changes_with_airport_name(self):
+        flight = sample_flight()
+        etag = self.client.get(FLIGHT_URL)["ETag"]
+
+        source = flight.route.source
+        source.name = "renamedairport"
+        source.save()
+        response = self.client.get(FLIGHT_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(
+            "renamedairport", response.data["results"][0]["route"]
+        )
 
     def test_filter_flights_by_departure_time_date(self):
         airplane = sample_airplane()
@@ -114,15 +190,44 @@ class AuthenticatedFlightApiTests(TestCase):
         )
         response = self.client.get(FLIGHT_URL, {"departure_time": "2024-01-27"})
 
-        remove_tickets_available(response.data)
+        remove_tickets_available(response.data["results"])
 
         serializer_1 = FlightListSerializer(flight_1)
         serializer_2 = FlightListSerializer(flight_2)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertIn(serializer_2.data, response.data)
-        self.assertNotIn(serializer_1.data, response.data)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIn(serializer_2.data, response.data["results"])
+        self.assertNotIn(serializer_1.data, response.data["results"])
+
+    def test_filter_flights_by_departure_time_date_bounds(self):
+        airplane = sample_airplane()
+        route = sample_route()
+        flight_start = Flight.objects.create(
+            route=route,
+            airplane=airplane,
+            departure_time="2024-01-27T00:00:00Z",
+            arrival_time="2024-01-27T10:00:00Z"
+        )
+        flight_end = Flight.objects.create(
+            route=route,
+            airplane=airplane,
+            departure_time="2024-01-27T23:59:59Z",
+            arrival_time="2024-01-28T10:00:00Z"
+        )
+        Flight.objects.create(
+            route=route,
+            airplane=airplane,
+            departure_time="2024-01-28T00:00:00Z",
+            arrival_time="2024-01-28T10:00:00Z"
+        )
+
+        response = self.client.get(FLIGHT_URL, {"departure_time": "2024-01-27"})
+
+        self.assertEqual(
+            {flight["id"] for flight in response.data["results"]},
+            {flight_start.id, flight_end.id}
+        )
 
     def test_filter_flights_by_route_id(self):
         airplane = sample_airplane()
@@ -147,13 +252,37 @@ class AuthenticatedFlightApiTests(TestCase):
             FLIGHT_URL, {"route": f"{route_1.id}"}
         )
 
-        remove_tickets_available(response.data)
+        remove_tickets_available(response.data["results"])
 
         serializer_1 = FlightListSerializer(flight_1)
         serializer_2 = FlightListSerializer(flight_2)
 
-        self.assertIn(serializer_1.data, response.data)
-        self.assertNotIn(serializer_2.data, response.data)
+        self.assertIn(serializer_1.data, response.data["results"])
+        self.assertNotIn(serializer_2.data, response.data["results"])
+
+    def test_flight_search_index_follows_changes(self):
+        flight = sample_flight()
+        order = Order.objects.create(user=self.user)
+        Ticket.objects.create(row=1, seat=1, flight=flight, order=order)
+        source = flight.route.source
+        source.name = "renamedairport"
+        source.save()
+
+        response = self.client.get(FLIGHT_SEARCH_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["id"], flight.id)
+        self.assertEqual(response.data["results"][0]["source_name"], "renamedairport")
+        self.assertEqual(
+            response.data["results"][0]["tickets_available"],
+            flight.airplane.capacity - 1
+        )
+
+        flight.delete()
+        response = self.client.get(FLIGHT_SEARCH_URL)
+
+        self.assertEqual(response.data["results"], [])
 
     def test_retrieve_flight_detail(self):
         flight = sample_flight()
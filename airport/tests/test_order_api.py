@@ -0,0 +1,205 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from rest_framework.test import APIClient
+
+from airport.models import Flight, FlightSearchIndex, Order, Ticket
+from airport.tests.test_flight_api import sample_flight
+
+ORDER_URL = reverse("airport:order-list")
+
+
+class UnauthenticatedOrderApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_auth_required(self):
+        response = self.client.get(ORDER_URL)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class AuthenticatedOrderApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            "test@testmail.com",
+            "testtest",
+        )
+        self.client.force_authenticate(self.user)
+        self.flight = sample_flight()
+
+    def test_create_order_with_tickets(self):
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": self.flight.id},
+                {"row": 1, "seat": 2, "flight": self.flight.id},
+                {"row": 2, "seat": 1, "flight": self.flight.id},
+            ]
+        }
+
+        response = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        order = Order.objects.get(id=response.data["id"])
+        self.assertEqual(order.user, self.user)
+        self.assertEqual(order.tickets.count(), 3)
+        self.assertEqual(len(response.data["tickets"]), 3)
+        self.assertEqual(
+            FlightSearchIndex.objects.get(flight=self.flight).tickets_taken, 3
+        )
+
+    def test_flight_tickets_taken_follows_tickets(self):
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": self.flight.id},
+                {"row": 1, "seat": 2, "flight": self.flight.id},
+            ]
+        }
+
+        response = self.client.post(ORDER_URL, payload, format="json")
+        self.flight.refresh_from_db()
+        self.assertEqual(self.flight.tickets_taken, 2)
+
+        order = Order.objects.get(id=response.data["id"])
+        Ticket.objects.create(row=2, seat=1, flight=self.flight, order=order)
+        self.flight.refresh_from_db()
+        self.assertEqual(self.flight.tickets_taken, 3)
+
+        order.delete()
+        self.flight.refresh_from_db()
+        self.assertEqual(self.flight.tickets_taken, 0)
+
+    def test_create_order_query_count_does_not_grow(self):
+        query_counts = []
+        for seat, rows in [(1, range(1, 3)), (2, range(1, 7))]:
+            payload = {
+                "tickets": [
+                    {"row": row, "seat": seat, "flight": self.flight.id}
+                    for row in rows
+                ]
+            }
+
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(ORDER_URL, payload, format="json")
+
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            query_counts.append(len(context.captured_queries))
+
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_create_order_seat_already_taken(self):
+        order = Order.objects.create(user=self.user)
+        Ticket.objects.create(row=1, seat=2, flight=self.flight, order=order)
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": self.flight.id},
+                {"row": 1, "seat": 2, "flight": self.flight.id},
+            ]
+        }
+
+        response = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Ticket.objects.count(), 1)
+
+    def test_create_order_ticket_out_of_range(self):
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": self.flight.id},
+                {"row": 100, "seat": 1, "flight": self.flight.id},
+            ]
+        }
+
+        response = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Order.objects.exists())
+        self.assertFalse(Ticket.objects.exists())
+
+    def test_flight_tickets_taken_follows_ticket_reassignment(self):
+        other_flight = Flight.objects.create(
+            route=self.flight.route,
+            airplane=self.flight.airplane,
+            departure_time=self.flight.departure_time,
+            arrival_time=self.flight.arrival_time,
+        )
+        order = Order.objects.create(user=self.user)
+        ticket = Ticket.objects.create(
+            row=1, seat=1, flight=self.flight, order=order
+        )
+
+        ticket.flight = other_flight
+        ticket.save()
+        self.flight.refresh_from_db()
+        other_flight.refresh_from_db()
+
+        self.assertEqual(self.flight.tickets_taken, 0)
+        self.assertEqual(other_flight.tickets_taken, 1)
+        self.assertEqual(
+            FlightSearchIndex.objects.get(flight=self.flight).tickets_taken, 0
+        )
+        self.assertEqual(
+            FlightSearchIndex.objects.get(flight=other_flight).tickets_taken, 1
+        )
+
+    def test_create_order_non_decimal_flight_id(self):
+        payload = {"tickets": [{"row": 1, "seat": 1, "flight": "\u00b2"}]}
+
+        response = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_order_duplicate_seat(self):
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": self.flight.id},
+                {"row": 1, "seat": 1, "flight": self.flight.id},
+            ]
+        }
+
+        response = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Ticket.objects.exists())
+
+    def test_list_orders_only_own(self):
+        other_user = get_user_model().objects.create_user(
+            "other@testmail.com",
+            "testtest",
+        )
+        own_order = Order.objects.create(user=self.user)
+        Ticket.objects.create(row=1, seat=1, flight=self.flight, order=own_order)
+        Order.objects.create(user=other_user)
+
+        response = self.client.get(ORDER_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["id"], own_order.id)
+        self.assertEqual(len(response.data["results"][0]["tickets"]), 1)
+
+    def test_list_orders_query_count_does_not_grow(self):
+        flights = [self.flight] + [
+            Flight.objects.create(
+                route=self.flight.route,
+                airplane=self.flight.airplane,
+                departure_time=self.flight.departure_time,
+                arrival_time=self.flight.arrival_time,
+            )
+            for _ in range(2)
+        ]
+        for flight in flights:
+            order = Order.objects.create(user=self.user)
+            Ticket.objects.create(row=1, seat=1, flight=flight, order=order)
+            Ticket.objects.create(row=1, seat=2, flight=flight, order=order)
+
+        with self.assertNumQueries(5):
+            response = self.client.get(ORDER_URL)
+
+        tickets = response.data["results"][-1]["tickets"]
+        self.assertEqual(tickets[0]["flight"]["tickets_available"], 14)
+        self.assertEqual(len(tickets[0]["flight"]["crew"]), 1)
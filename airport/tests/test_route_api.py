@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
@@ -51,6 +52,7 @@ class AuthenticatedRouteAPITest(TestCase):
             "testtset",
         )
         self.client.force_authenticate(self.user)
+        caches["api_lists"].clear()
 
     def test_list_routes(self):
         airport_start = sample_airport(name="testairport2")
@@ -63,7 +65,7 @@ class AuthenticatedRouteAPITest(TestCase):
         response = self.client.get(ROUTE_URL)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data["results"], serializer.data)
 
     def test_filter_routes_by_airports_name(self):
         airport_start = sample_airport(name="testairport2")
@@ -76,13 +78,29 @@ class AuthenticatedRouteAPITest(TestCase):
 
         response = self.client.get(ROUTE_URL, {"source": airport_start.name})
 
-        self.assertIn(serializer_1.data, response.data)
-        self.assertNotIn(serializer_2.data, response.data)
+        self.assertIn(serializer_1.data, response.data["results"])
+        self.assertNotIn(serializer_2.data, response.data["results"])
 
         response = self.client.get(ROUTE_URL, {"destination": airport_end.name})
 
-        self.assertIn(serializer_1.data, response.data)
-        self.assertNotIn(serializer_2.data, response.data)
+        self.assertIn(serializer_1.data, response.data["results"])
+        self.assertNotIn(serializer_2.data, response.data["results"])
+
+    def test_list_routes_cache_cleared_on_route_change(self):
+        sample_route()
+
+        response = self.client.get(ROUTE_URL)
+        self.assertEqual(len(response.data["results"]), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Route.objects.create(
+                source=sample_airport(name="newsource"),
+                destination=sample_airport(name="newdestination"),
+                distance=100,
+            )
+        response = self.client.get(ROUTE_URL)
+
+        self.assertEqual(len(response.data["results"]), 2)
 
     def test_create_route_forbidden(self):
         airport_start = sample_airport(name="testtairport")
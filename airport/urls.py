@@ -8,7 +8,8 @@ from airport.views import (
     CrewViewSet,
     RouteViewSet,
     OrderViewSet,
-    FlightViewSet
+    FlightViewSet,
+    FlightSearchViewSet
 )
 
 router = routers.DefaultRouter()
@@ -19,6 +20,7 @@ router.register("crew", CrewViewSet)
 router.register("routes", RouteViewSet)
 router.register("orders", OrderViewSet)
 router.register("flights", FlightViewSet)
+router.register("flight_search", FlightSearchViewSet)
 
 urlpatterns = [path("", include(router.urls))]
 
@@ -1,6 +1,19 @@
-from datetime import datetime
-
-from django.db.models import F, Count
+import hashlib
+from datetime import date, datetime, time, timedelta
+
+from django.conf import settings
+from django.db.models import (
+    F,
+    Count,
+    ExpressionWrapper,
+    IntegerField,
+    Max,
+    Prefetch,
+)
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from rest_framework import mixins, viewsets, status
@@ -16,7 +29,8 @@ from airport.models import (
     Crew,
     Route,
     Order,
-    Flight
+    Flight,
+    FlightSearchIndex
 )
 from airport.permissions import IsAuthenticatedOrIsAdminReadOnly
 from airport.serializers import (
@@ -33,10 +47,105 @@ from airport.serializers import (
     FlightListSerializer,
     FlightDetailSerializer,
     AirplaneListSerializer,
-    AirplaneImageSerializer
+    AirplaneImageSerializer,
+    FlightSearchSerializer
+)
+
+FLIGHT_LIST_QUERYSET = (
+    Flight.objects.all()
+    .select_related("route__source", "route__destination", "airplane")
+    .prefetch_related(
+        Prefetch(
+            "crew",
+            queryset=Crew.objects.only("id", "first_name", "last_name")
+        )
+    )
+    .annotate(
+        tickets_available=ExpressionWrapper(
+            F("airplane__capacity") - F("tickets_taken"),
+            output_field=IntegerField()
+        )
+    )
 )
 
+FLIGHT_FILTER_PARAMETERS = [
+    OpenApiParameter(
+        "route",
+        type=OpenApiTypes.INT,
+        description="Filter by route id (ex. ?route=1)",
+    ),
+    OpenApiParameter(
+        "departure_time",
+        type=OpenApiTypes.DATE,
+        description=(
+                "Filter by datetime of departure time "
+                "(ex. ?departure_date=2024-01-01)"
+        ),
+    ),
+]
+
+
+def filter_flights(queryset, query_params):
+    departure_time = query_params.get("departure_time")
+    route_id_str = query_params.get("route")
+
+    if departure_time:
+        start = timezone.make_aware(
+            datetime.combine(date.fromisoformat(departure_time), time.min)
+        )
+        queryset = queryset.filter(
+            departure_time__gte=start,
+            departure_time__lt=start + timedelta(days=1)
+        )
+
+    if route_id_str:
+        queryset = queryset.filter(route_id=int(route_id_str))
+
+    return queryset
 
+
+class ETagListMixin:
+    etag_updated_fields = ("updated_at",)
+
+    def get_list_etag(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        stats = queryset.aggregate(
+            count=Count("id"),
+            **{
+                field: Max(field)
+                for field in self.etag_updated_fields
+            }
+        )
+        fingerprint = ":".join(
+            [request.get_full_path()]
+            + [str(stats[key]) for key in sorted(stats)]
+        )
+        return quote_etag(
+            hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()
+        )
+
+    def list(self, request, *args, **kwargs):
+        etag = self.get_list_etag(request)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        response["ETag"] = etag
+        return response
+
+
+class ListPagination(PageNumberPagination):
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+
+cache_list = method_decorator(
+    cache_page(settings.API_LIST_CACHE_TIMEOUT, cache="api_lists"),
+    name="list"
+)
+
+
+@cache_list
 class AirportViewSet(
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
@@ -47,6 +156,7 @@ class AirportViewSet(
     permission_classes = (IsAuthenticatedOrIsAdminReadOnly,)
 
 
+@cache_list
 class RouteViewSet(
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
@@ -55,13 +165,16 @@ class RouteViewSet(
 ):
     queryset = Route.objects.select_related("source", "destination")
     serializer_class = RouteSerializer
+    pagination_class = ListPagination
     permission_classes = (IsAuthenticatedOrIsAdminReadOnly,)
 
     def get_queryset(self):
         source_str = self.request.query_params.get("source")
         destination_str = self.request.query_params.get("destination")
-        queryset = self.queryset
+        queryset = super().get_queryset()
 
+        # icontains compiles to UPPER(name) LIKE '%...%', which is served
+        # by the airport_name_upper_trgm GIN index.
         if source_str:
             queryset = queryset.filter(source__name__icontains=source_str)
         if destination_str:
@@ -69,7 +182,7 @@ class RouteViewSet(
                 destination__name__icontains=destination_str
             )
 
-        return queryset.distinct()
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -96,6 +209,7 @@ class RouteViewSet(
         return super().list(request, *args, **kwargs)
 
 
+@cache_list
 class AirplaneTypeViewSet(
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
@@ -107,14 +221,33 @@ class AirplaneTypeViewSet(
 
 
 class AirplaneViewSet(
+    ETagListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     viewsets.GenericViewSet
 ):
     queryset = Airplane.objects.select_related("airplane_type")
     serializer_class = AirplaneSerializer
+    pagination_class = ListPagination
     permission_classes = (IsAuthenticatedOrIsAdminReadOnly,)
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        if self.action == "list":
+            queryset = queryset.only(
+                "id",
+                "name",
+                "rows",
+                "seats_in_row",
+                "capacity",
+                "image",
+                "airplane_type",
+                "airplane_type__name",
+            )
+
+        return queryset
+
     def get_serializer_class(self):
         if self.action == "list":
             return AirplaneListSerializer
@@ -159,15 +292,14 @@ class OrderViewSet(
     viewsets.GenericViewSet
 ):
     queryset = Order.objects.prefetch_related(
-        "tickets__flight__route",
-        "tickets__flight__airplane"
+        Prefetch("tickets__flight", queryset=FLIGHT_LIST_QUERYSET)
     )
     serializer_class = OrderSerializer
     pagination_class = OrderPagination
     permission_classes = (IsAuthenticated,)
 
     def get_queryset(self):
-        return Order.objects.filter(user=self.request.user.pk)
+        return self.queryset.filter(user=self.request.user)
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -175,38 +307,20 @@ class OrderViewSet(
         return OrderSerializer
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user.pk)
-
-
-class FlightViewSet(viewsets.ModelViewSet):
-    queryset = (
-        Flight.objects.all()
-        .select_related("route", "airplane")
-        .prefetch_related("crew")
-        .annotate(
-            tickets_available=(
-                    F("airplane__rows") * F("airplane__seats_in_row")
-                    - Count("tickets")
-            )
-        )
-    )
+        serializer.save(user=self.request.user)
+
+
+class FlightViewSet(ETagListMixin, viewsets.ModelViewSet):
+    queryset = FLIGHT_LIST_QUERYSET
+    etag_updated_fields = ("updated_at", "airplane__updated_at")
     serializer_class = FlightSerializer
+    pagination_class = ListPagination
     permission_classes = (IsAuthenticatedOrIsAdminReadOnly,)
 
     def get_queryset(self):
-        departure_time = self.request.query_params.get("departure_time")
-        route_id_str = self.request.query_params.get("route")
-
-        queryset = self.queryset
-
-        if departure_time:
-            date = datetime.strptime(departure_time, "%Y-%m-%d").date()
-            queryset = queryset.filter(departure_time__date=date)
-
-        if route_id_str:
-            queryset = queryset.filter(route_id=int(route_id_str))
-
-        return queryset
+        return filter_flights(
+            super().get_queryset(), self.request.query_params
+        )
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -215,22 +329,21 @@ class FlightViewSet(viewsets.ModelViewSet):
             return FlightDetailSerializer
         return FlightSerializer
 
-    @extend_schema(
-        parameters=[
-            OpenApiParameter(
-                "route",
-                type=OpenApiTypes.INT,
-                description="Filter by route id (ex. ?route=1)",
-            ),
-            OpenApiParameter(
-                "departure_time",
-                type=OpenApiTypes.DATE,
-                description=(
-                        "Filter by datetime of departure time "
-                        "(ex. ?departure_date=2024-01-01)"
-                ),
-            ),
-        ]
-    )
+    @extend_schema(parameters=FLIGHT_FILTER_PARAMETERS)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+
+class FlightSearchViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    queryset = FlightSearchIndex.objects.all()
+    serializer_class = FlightSearchSerializer
+    permission_classes = (IsAuthenticatedOrIsAdminReadOnly,)
+
+    def get_queryset(self):
+        return filter_flights(
+            super().get_queryset(), self.request.query_params
+        )
+
+    @extend_schema(parameters=FLIGHT_FILTER_PARAMETERS)
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)